@@ -11,26 +11,43 @@ Controls:
 
 How to run:
   1. Install Python 3.8+ (3.10+ recommended).
-  2. Install pygame:     pip install pygame
+  2. Install pygame and numpy:     pip install pygame numpy
+     (optional) pip install numba  — JIT-compiles the per-frame update loops
   3. Save this file as space_shooter.py and run:   python space_shooter.py
 
 Enjoy! - Code written for easy reading and customization.
 """
 
 import pygame
-import random
 import sys
+import functools
+from collections import defaultdict
+import numpy as np
 from pygame.locals import *
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the NumPy code paths are used instead
+    njit = None
+
 # ---------- Configuration ----------
 WIDTH, HEIGHT = 480, 720
 FPS = 60
+FIXED_DT = 1.0 / FPS   # game logic always advances in steps of this size
+MAX_STEPS_PER_FRAME = 5  # after a long stall, drop time instead of running a burst of catch-up steps
+FRAME_SNAP = 0.002     # frame times this close to FIXED_DT count as exactly one step (the clock is in whole ms)
+BG_COLOR = (20, 28, 36)
 SCALE = 5              # scale factor for pixel-art sprites (change to make sprites bigger/smaller)
 PLAYER_SPEED = 300     # pixels per second
 BULLET_SPEED = 480
 ENEMY_SPEED = 80
 ENEMY_SPAWN_INTERVAL = 0.9
 MAX_ENEMIES = 6
+# speeds above converted to pixels per fixed step
+PLAYER_STEP = PLAYER_SPEED * FIXED_DT
+BULLET_STEP = BULLET_SPEED * FIXED_DT
+ENEMY_STEP = ENEMY_SPEED * FIXED_DT
+COLLISION_CELL = 32    # column width (px) of the bullet spatial hash
 
 # Optional developer credit (set to empty string to hide)
 DEVELOPER_CREDIT = "Developed by Keyur Padia"
@@ -40,21 +57,80 @@ DEVELOPER_CREDIT = "Developed by Keyur Padia"
 def sprite_from_map(map_rows, palette, scale=SCALE):
     """Create a pygame.Surface from a list of strings. Each char maps to a palette color.
     ' ' (space) means transparent.
+    Results are memoized per (map, palette, scale), so callers get a shared surface and must not draw on it.
     """
+    return _cached_sprite(tuple(map_rows), tuple(sorted(palette.items())), scale)
+
+
+@functools.lru_cache(maxsize=64)
+def _cached_sprite(map_rows, palette_items, scale):
     h = len(map_rows)
     w = max(len(r) for r in map_rows)
+    char_arr = np.array([list(r.ljust(w)) for r in map_rows])
+    # palette lookup table indexed by character code; unknown chars show up magenta
+    lut = np.full((256, 4), (255, 0, 255, 255), dtype=np.uint8)
+    for ch, rgb in palette_items:
+        lut[ord(ch)] = (*rgb[:3], 255)
+    lut[ord(' ')] = (0, 0, 0, 0)
+    rgba = lut[char_arr.view(np.uint32).astype(np.uint8)]
     surface = pygame.Surface((w, h), flags=SRCALPHA, depth=32)
-    surface.fill((0, 0, 0, 0))
-    for y, row in enumerate(map_rows):
-        for x, ch in enumerate(row):
-            if ch == ' ':
-                continue
-            color = palette.get(ch, (255, 0, 255))
-            surface.set_at((x, y), color)
+    # surfarray views are indexed [x, y], the map is [y, x]
+    pygame.surfarray.pixels3d(surface)[:] = rgba[..., :3].transpose(1, 0, 2)
+    pygame.surfarray.pixels_alpha(surface)[:] = rgba[..., 3].T
     # scale nearest neighbor to keep pixel-art crisp
     surf_scaled = pygame.transform.scale(surface, (w * scale, h * scale))
     return surf_scaled
 
+
+_HAS_FBLITS = hasattr(pygame.Surface, 'fblits')
+
+
+def blit_batch(surface, seq):
+    """Blit a list of (image, dest) pairs in one call.
+    Surface.fblits only exists in pygame-ce; plain pygame falls back to blits without collecting rects.
+    """
+    if _HAS_FBLITS:
+        surface.fblits(seq)
+    else:
+        surface.blits(seq, doreturn=False)
+
+# ---------- Fixed-step integration kernels (JIT-compiled when numba is installed) ----------
+# Sprite speeds are stored in pixels per step; star speeds stay in pixels per second and are
+# scaled by FIXED_DT, which numba freezes into the compiled code as a constant.
+
+_HAS_NUMBA = njit is not None
+
+
+def _step_sprites(ys, vys, alive, n, max_top, min_bottom, height):
+    for i in range(n):
+        if alive[i]:
+            ys[i] += vys[i]
+            if ys[i] >= max_top or ys[i] + height <= min_bottom:
+                alive[i] = False
+
+
+def _step_stars(xs, ys, speeds, rng, width, height):
+    for i in range(ys.size):
+        ys[i] += speeds[i] * FIXED_DT
+        if ys[i] > height:
+            xs[i] = rng.integers(0, width)
+            ys[i] = -2
+            speeds[i] = rng.uniform(5, 25)
+
+
+if _HAS_NUMBA:
+    _step_sprites = njit(cache=True, fastmath=True)(_step_sprites)
+    _step_stars = njit(cache=True, fastmath=True)(_step_stars)
+
+
+def warm_up_kernels():
+    """Run each kernel once on dummy data so JIT compilation happens at startup, not mid-game."""
+    if not _HAS_NUMBA:
+        return
+    f = np.zeros(1, dtype=np.float32)
+    _step_sprites(f, f.copy(), np.zeros(1, dtype=bool), 1, 1.0, -1.0, 1)
+    _step_stars(np.zeros(1, dtype=np.int32), f.copy(), f.copy(), np.random.default_rng(), 1, 1)
+
 # ---------- Pixel maps and palettes ----------
 PLAYER_MAP = [
     "     r     ",
@@ -98,6 +174,19 @@ AST_PALETTE = {'z': (200, 120, 40)}
 BULLET_MAP = ["o"]
 BULLET_PALETTE = {'o': (255, 200, 50)}
 
+# ---------- Input ----------
+INPUT_LEFT = 1
+INPUT_RIGHT = 2
+INPUT_FIRE = 4
+
+
+def poll_inputs(keys):
+    """Pack the keys the game cares about into a small bitmask (INPUT_* flags), read once per frame."""
+    return ((INPUT_LEFT if keys[K_LEFT] or keys[K_a] else 0)
+            | (INPUT_RIGHT if keys[K_RIGHT] or keys[K_d] else 0)
+            | (INPUT_FIRE if keys[K_SPACE] or keys[K_UP] else 0))
+
+
 # ---------- Game objects ----------
 class Player(pygame.sprite.Sprite):
     def __init__(self, image):
@@ -105,24 +194,20 @@ class Player(pygame.sprite.Sprite):
         self.original_image = image
         self.image = image
         self.rect = self.image.get_rect(midbottom=(WIDTH // 2, HEIGHT - 40))
-        self.speed = PLAYER_SPEED
+        self.speed = PLAYER_STEP
         self.shoot_cooldown = 0.18
         self._cool = 0
 
-    def update(self, dt, keys):
-        move = 0
-        if keys[K_LEFT] or keys[K_a]:
-            move -= 1
-        if keys[K_RIGHT] or keys[K_d]:
-            move += 1
-        self.rect.x += move * self.speed * dt
+    def update(self, input_bits):
+        move = bool(input_bits & INPUT_RIGHT) - bool(input_bits & INPUT_LEFT)
+        self.rect.x += move * self.speed
         # clamp
         if self.rect.left < 8:
             self.rect.left = 8
         if self.rect.right > WIDTH - 8:
             self.rect.right = WIDTH - 8
         if self._cool > 0:
-            self._cool -= dt
+            self._cool -= FIXED_DT
 
     def can_shoot(self):
         return self._cool <= 0
@@ -131,61 +216,224 @@ class Player(pygame.sprite.Sprite):
         self._cool = self.shoot_cooldown
 
 
-class Bullet(pygame.sprite.Sprite):
-    def __init__(self, x, y, image, dy=-BULLET_SPEED):
+class Enemy(pygame.sprite.Sprite):
+    def __init__(self, image, x, y):
         super().__init__()
         self.image = image
         self.rect = self.image.get_rect(center=(x, y))
-        self.dy = dy
 
-    def update(self, dt):
-        self.rect.y += self.dy * dt
-        if self.rect.bottom < -10 or self.rect.top > HEIGHT + 10:
-            self.kill()
 
+class FastGroup(pygame.sprite.Group):
+    """Group that draws with a single batched blit.
+    The (image, rect) drawlist is rebuilt only when membership changes; rects are shared with
+    the sprites, so moving a sprite in place needs no rebuild (replacing its .image or .rect does).
+    """
 
-class Enemy(pygame.sprite.Sprite):
-    def __init__(self, image, x, y, speed=ENEMY_SPEED):
-        super().__init__()
-        self.image = image
-        self.rect = self.image.get_rect(center=(x, y))
-        self.speed = speed
-        self.hp = 1
+    def __init__(self, *sprites):
+        self._drawlist = []
+        self._dirty = True
+        super().__init__(*sprites)
+
+    # add_internal/remove_internal also catch sprite.kill() and empty(), not just add()/remove()
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        self._dirty = True
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        self._dirty = True
+
+    def draw(self, surface):
+        if self._dirty:
+            self._drawlist = [(s.image, s.rect) for s in self.sprites()]
+            self._dirty = False
+        blit_batch(surface, self._drawlist)
+
+
+def _advance(ys, vys, alive, n, max_top, min_bottom, height):
+    """Move the first n entries one step by vys and clear alive for those that left the band."""
+    if _HAS_NUMBA:
+        _step_sprites(ys, vys, alive, n, max_top, min_bottom, height)
+    else:
+        live_ys = ys[:n]
+        live_ys += vys[:n]
+        alive[:n] &= (live_ys < max_top) & (live_ys + height > min_bottom)
+
+
+class SpriteArray:
+    """Fixed pool of sprites sharing one image, moved together with NumPy.
+    Each of the `capacity` slots has an entry in the y/speed/hp arrays and a preallocated Sprite
+    wrapper, which sits in `group` (for drawing and collisions) only while the slot is alive.
+    Entries only move vertically, so x stays on the wrapper's rect.
+    Nothing is allocated after __init__. Entries whose top passes `max_top` or whose bottom
+    passes `min_bottom` are dropped.
+    """
 
-    def update(self, dt):
-        self.rect.y += self.speed * dt
-        if self.rect.top > HEIGHT + 20:
-            self.kill()
+    def __init__(self, image, sprite_cls, max_top, min_bottom=-1e9, capacity=16):
+        self.image = image
+        self.max_top = float(max_top)
+        self.min_bottom = float(min_bottom)
+        self.ys = np.zeros(capacity, dtype=np.float32)
+        self.vys = np.zeros(capacity, dtype=np.float32)
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.hps = np.zeros(capacity, dtype=np.int8)
+        self.count = 0
+        self.sprites = [sprite_cls(image, 0, 0) for _ in range(capacity)]
+        self.group = FastGroup()
+
+    def __len__(self):
+        return self.count
+
+    def spawn(self, x, y, vy, hp=1):
+        """Put an entry centred on (x, y) moving vy pixels per step into the first free slot.
+        Returns False when every slot is taken.
+        """
+        i = int(self.alive.argmin())
+        if self.alive[i]:
+            return False
+        sprite = self.sprites[i]
+        sprite.rect.center = (x, y)
+        self.ys[i] = sprite.rect.y
+        self.vys[i] = vy
+        self.alive[i] = True
+        self.hps[i] = hp
+        self.count += 1
+        self.group.add(sprite)
+        return True
+
+    def update(self):
+        _advance(self.ys, self.vys, self.alive, self.alive.size,
+                 self.max_top, self.min_bottom, self.image.get_height())
+        self.sync()
+
+    def sync(self):
+        """Move live wrappers to their array positions and take cleared slots out of the group."""
+        for sprite, alive, y in zip(self.sprites, self.alive.tolist(), self.ys.tolist()):
+            if alive:
+                sprite.rect.y = int(y)
+            elif sprite.alive():
+                sprite.kill()
+                self.count -= 1
+
+    def clear(self):
+        self.alive[:] = False
+        self.count = 0
+        self.group.empty()
+
+
+def _grow(arr, cap):
+    """Copy arr into a zero-filled array of length cap (np.resize would repeat the old data instead)."""
+    out = np.zeros(cap, dtype=arr.dtype)
+    out[:arr.size] = arr
+    return out
+
+
+class BulletArray:
+    """Bullets as flat arrays with no per-bullet Python object.
+    Live bullets are packed into the first `n` slots and storage doubles when full.
+    Bullets whose top passes `max_top` or whose bottom passes `min_bottom` are dropped.
+    """
+    __slots__ = ('xs', 'ys', 'vys', 'alive', 'n', 'img', 'img_rect_w', 'img_rect_h', 'max_top', 'min_bottom')
+
+    def __init__(self, img, max_top, min_bottom, capacity=16):
+        self.img = img
+        self.img_rect_w, self.img_rect_h = img.get_size()
+        self.max_top = float(max_top)
+        self.min_bottom = float(min_bottom)
+        self.xs = np.zeros(capacity, dtype=np.float32)
+        self.ys = np.zeros(capacity, dtype=np.float32)
+        self.vys = np.zeros(capacity, dtype=np.float32)
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.n = 0
+
+    def __len__(self):
+        return self.n
+
+    def spawn(self, x, y, vy):
+        """Add a bullet centred on (x, y) moving vy pixels per step."""
+        if self.n == self.xs.size:
+            cap = self.xs.size * 2
+            self.xs = _grow(self.xs, cap)
+            self.ys = _grow(self.ys, cap)
+            self.vys = _grow(self.vys, cap)
+            self.alive = _grow(self.alive, cap)
+        i = self.n
+        self.xs[i] = x - self.img_rect_w // 2
+        self.ys[i] = y - self.img_rect_h // 2
+        self.vys[i] = vy
+        self.alive[i] = True
+        self.n += 1
+
+    def update(self):
+        _advance(self.ys, self.vys, self.alive, self.n,
+                 self.max_top, self.min_bottom, self.img_rect_h)
+        self.compact()
+
+    def compact(self):
+        """Drop bullets whose alive flag was cleared, keeping the live ones packed at the front."""
+        n = self.n
+        keep = self.alive[:n]
+        if keep.all():
+            return
+        idx = np.flatnonzero(keep)
+        m = idx.size
+        for arr in (self.xs, self.ys, self.vys):
+            arr[:m] = arr[idx]
+        self.alive[:m] = True
+        self.alive[m:n] = False
+        self.n = m
+
+    def positions(self):
+        """Integer top-left corners of the live bullets, as a list of [x, y]."""
+        n = self.n
+        return np.column_stack((self.xs[:n], self.ys[:n])).astype(np.int32).tolist()
+
+    def draw(self, surface):
+        """Blit every live bullet in one batch and return their rects as (x, y, w, h) tuples."""
+        img, w, h = self.img, self.img_rect_w, self.img_rect_h
+        pts = self.positions()
+        blit_batch(surface, [(img, p) for p in pts])
+        return [(x, y, w, h) for x, y in pts]
+
+    def clear(self):
+        self.alive[:] = False
+        self.n = 0
 
 
 # ---------- Helper drawing: stars and decorative items ----------
 
+_rng = np.random.default_rng()  # shared by the NumPy and JIT paths (numba accepts Generator arguments)
+
 def build_starfield(count=80):
-    stars = []
-    for _ in range(count):
-        x = random.randrange(0, WIDTH)
-        y = random.randrange(0, HEIGHT)
-        size = random.choice([1, 1, 2])
-        speed = random.uniform(5, 25)
-        stars.append([x, y, size, speed])
-    return stars
-
-
-def update_starfield(stars, dt):
-    for s in stars:
-        s[1] += s[3] * dt
-        if s[1] > HEIGHT:
-            s[0] = random.randrange(0, WIDTH)
-            s[1] = -2
-            s[3] = random.uniform(5, 25)
-
-
-def draw_starfield(surface, stars):
-    for s in stars:
-        if s[2] == 1:
-            surface.fill((220, 220, 220), (int(s[0]), int(s[1]), 1, 1))
-        else:
-            pygame.draw.rect(surface, (180, 180, 180), (int(s[0]), int(s[1]), 2, 2))
+    """Stars are kept as parallel arrays (x, y, size, speed) so a frame update is a few array ops."""
+    xs = _rng.integers(0, WIDTH, count, dtype=np.int32)
+    ys = _rng.integers(0, HEIGHT, count).astype(np.float32)
+    sizes = (_rng.integers(0, 3, count, dtype=np.int8) // 2) + 1  # 1, 1 or 2: small stars twice as common
+    speeds = _rng.uniform(5, 25, count).astype(np.float32)
+    return {'xs': xs, 'ys': ys, 'sizes': sizes, 'speeds': speeds}
+
+
+def update_starfield(stars):
+    """Advance the stars by one fixed step."""
+    xs, ys, speeds = stars['xs'], stars['ys'], stars['speeds']
+    if _HAS_NUMBA:
+        _step_stars(xs, ys, speeds, _rng, WIDTH, HEIGHT)
+        return
+    ys += speeds * FIXED_DT
+    # stars that fell off the bottom come back at the top with a new column and speed
+    wrapped = ys > HEIGHT
+    n = int(wrapped.sum())
+    if n:
+        xs[wrapped] = _rng.integers(0, WIDTH, n)
+        ys[wrapped] = -2
+        speeds[wrapped] = _rng.uniform(5, 25, n)
+
+
+def draw_starfield(surface, stars, small_star, big_star):
+    xs, ys, sizes = stars['xs'], stars['ys'], stars['sizes']
+    for tile, mask in ((small_star, sizes == 1), (big_star, sizes != 1)):
+        pts = np.column_stack((xs[mask], ys[mask].astype(np.int32))).tolist()
+        blit_batch(surface, [(tile, p) for p in pts])
 
 
 # Decorative shapes drawn as scaled pixel sprites (planet, saucer, comet)
@@ -218,36 +466,60 @@ class Game:
     def __init__(self):
         pygame.init()
         pygame.display.set_caption("Retro Space Shooter")
+        warm_up_kernels()
         self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
         self.clock = pygame.time.Clock()
         self.font = pygame.font.Font(pygame.font.get_default_font(), 20)
         self.title_font = pygame.font.Font(pygame.font.get_default_font(), 48)
 
-        # build sprites
-        self.player_sprite = sprite_from_map(PLAYER_MAP, PLAYER_PALETTE)
-        self.enemy_sprite = sprite_from_map(ENEMY_MAP, ENEMY_PALETTE)
-        self.asteroid_sprite = sprite_from_map(ASTEROID_MAP, AST_PALETTE)
-        self.bullet_sprite = sprite_from_map(BULLET_MAP, BULLET_PALETTE, scale=3)
-        self.planet_sprite = sprite_from_map(PLANET_MAP, PLANET_PALETTE)
-        self.saucer_sprite = sprite_from_map(SAUCER_MAP, SAUCER_PALETTE)
-        self.comet_sprite = sprite_from_map(COMET_MAP, COMET_PALETTE)
+        # build sprites (converted to the display's pixel format once so blits skip conversion)
+        self.player_sprite = sprite_from_map(PLAYER_MAP, PLAYER_PALETTE).convert_alpha()
+        self.enemy_sprite = sprite_from_map(ENEMY_MAP, ENEMY_PALETTE).convert_alpha()
+        self.asteroid_sprite = sprite_from_map(ASTEROID_MAP, AST_PALETTE).convert_alpha()
+        self.bullet_sprite = sprite_from_map(BULLET_MAP, BULLET_PALETTE, scale=3).convert_alpha()
+        self.planet_sprite = sprite_from_map(PLANET_MAP, PLANET_PALETTE).convert_alpha()
+        self.saucer_sprite = sprite_from_map(SAUCER_MAP, SAUCER_PALETTE).convert_alpha()
+        self.comet_sprite = sprite_from_map(COMET_MAP, COMET_PALETTE).convert_alpha()
 
         # groups
-        self.player_group = pygame.sprite.Group()
-        self.bullet_group = pygame.sprite.Group()
-        self.enemy_group = pygame.sprite.Group()
+        self.player_group = FastGroup()
+        self.bullets = BulletArray(self.bullet_sprite, max_top=HEIGHT + 10, min_bottom=-10)
+        self.enemies = SpriteArray(self.enemy_sprite, Enemy, max_top=HEIGHT + 20, capacity=MAX_ENEMIES)  # never grows
+        self._bullet_cols = defaultdict(list)  # bullets bucketed by x // COLLISION_CELL
 
         self.player = Player(self.player_sprite)
         self.player_group.add(self.player)
 
-        # stars
+        # stars (one tiny tile per size class, blitted in batches)
         self.stars = build_starfield(120)
+        self._star1 = pygame.Surface((1, 1))
+        self._star1.fill((220, 220, 220))
+        self._star2 = pygame.Surface((2, 2))
+        self._star2.fill((180, 180, 180))
+        self._bg_tile = pygame.Surface((2, 2))
+        self._bg_tile.fill(BG_COLOR)
+
+        # dirty-rect clearing: only what was drawn last frame is painted over with the background
+        self._star_prev = np.empty((0, 2), dtype=np.int32)  # star positions drawn last frame
+        self._drawn = []         # rects of everything else drawn last frame
+        self._drawn_state = None  # state shown last frame; a change forces a full clear
 
         # timers and state
         self.enemy_spawn_timer = 0
         self.score = 0
         self.state = 'MENU'  # MENU, PLAYING, GAME_OVER
         self.game_over_timer = 0
+        self._acc = 0.0  # real time not yet simulated, carried over to the next frame
+
+        # text that never changes is rendered once; the score label only when the score changes
+        self._title_surf = self.title_font.render('SPACE SHOOTER', True, (240, 230, 210))
+        self._title_shadow = self.title_font.render('SPACE SHOOTER', True, (40, 30, 30))
+        self._hint_menu = self.font.render('Press ENTER to start', True, (220,220,220))
+        self._credit = self.font.render(DEVELOPER_CREDIT, True, (180,180,180)) if DEVELOPER_CREDIT else None
+        self._gameover_surf = self.title_font.render('GAME OVER', True, (240,230,210))
+        self._gameover_shadow = self.title_font.render('GAME OVER', True, (40,30,30))
+        self._restart_hint = self.font.render('Press ENTER to play again', True, (200,200,200))
+        self._score_cache = (-1, None)
 
         # decorative positions (used in menus)
         self.decor_positions = [
@@ -255,27 +527,66 @@ class Game:
             (WIDTH - 70, 70, 'saucer'),
             (WIDTH - 90, HEIGHT - 120, 'comet'),
         ]
+        self._build_static_blits()
+
+    def _build_static_blits(self):
+        """Lay out everything on the menu and game-over screens that never moves, once."""
+        sprites = {'planet': self.planet_sprite, 'saucer': self.saucer_sprite, 'comet': self.comet_sprite}
+
+        # menu: title with a simple shadow, player ship, decorations, start hint, optional credit
+        title_rect = self._title_surf.get_rect(center=(WIDTH//2, 80))
+        menu = [
+            (self._title_shadow, self._title_shadow.get_rect(center=(title_rect.centerx+3, title_rect.centery+3))),
+            (self._title_surf, title_rect),
+            (self.player_sprite, self.player_sprite.get_rect(center=(WIDTH//2, HEIGHT//2 - 10))),
+        ]
+        menu += [(sprites[t], sprites[t].get_rect(center=(x, y))) for x, y, t in self.decor_positions]
+        menu.append((self._hint_menu, self._hint_menu.get_rect(center=(WIDTH//2, HEIGHT - 120))))
+        if self._credit:
+            menu.append((self._credit, self._credit.get_rect(center=(WIDTH//2, HEIGHT - 40))))
+        self._menu_blits = menu
+
+        # game over: decorations in the corners, big text, a row of small stars, restart hint
+        # ('Developed by' is left off the game over screen on purpose)
+        over_rect = self._gameover_surf.get_rect(center=(WIDTH//2, HEIGHT//2 - 60))
+        dot = pygame.Surface((3, 3))
+        dot.fill((180, 180, 180))
+        game_over = [
+            (self.planet_sprite, self.planet_sprite.get_rect(topleft=(20, 20))),
+            (self.saucer_sprite, self.saucer_sprite.get_rect(topright=(WIDTH - 20, 20))),
+            (self.comet_sprite, self.comet_sprite.get_rect(bottomright=(WIDTH - 20, HEIGHT - 20))),
+            (self._gameover_shadow, self._gameover_shadow.get_rect(center=(over_rect.centerx+3, over_rect.centery+3))),
+            (self._gameover_surf, over_rect),
+        ]
+        game_over += [(dot, dot.get_rect(topleft=(40 + i * 60, HEIGHT//2 + 120 + (i % 2) * 10))) for i in range(6)]
+        game_over.append((self._restart_hint, self._restart_hint.get_rect(center=(WIDTH//2, HEIGHT - 80))))
+        self._game_over_blits = game_over
 
     def reset(self):
-        self.enemy_group.empty()
-        self.bullet_group.empty()
+        self.enemies.clear()
+        self.bullets.clear()
         self.player.rect.midbottom = (WIDTH // 2, HEIGHT - 40)
         self.score = 0
         self.enemy_spawn_timer = 0
 
     def spawn_enemy(self):
-        if len(self.enemy_group) >= MAX_ENEMIES:
+        if len(self.enemies) >= MAX_ENEMIES:
             return
-        x = random.randint(30, WIDTH - 30)
+        x = int(_rng.integers(30, WIDTH - 30, endpoint=True))
         y = -30
-        e = Enemy(self.enemy_sprite, x, y, speed=ENEMY_SPEED + random.uniform(-10, 40))
-        self.enemy_group.add(e)
+        self.enemies.spawn(x, y, ENEMY_STEP + _rng.uniform(-10, 40) * FIXED_DT)
 
     def run(self):
         running = True
         while running:
-            dt = self.clock.tick(FPS) / 1000.0
-            for event in pygame.event.get():
+            # accumulate real time, then run as many fixed steps as it covers
+            frame = self.clock.tick_busy_loop(FPS) / 1000.0
+            if abs(frame - FIXED_DT) < FRAME_SNAP:
+                frame = FIXED_DT
+            self._acc += frame
+            self._acc = min(self._acc, MAX_STEPS_PER_FRAME * FIXED_DT)
+            # only QUIT/KEYDOWN are handled; fetch just those and drop the rest (mouse motion etc.)
+            for event in pygame.event.get((QUIT, KEYDOWN)):
                 if event.type == QUIT:
                     running = False
                 elif event.type == KEYDOWN:
@@ -287,52 +598,111 @@ class Game:
                     if self.state == 'GAME_OVER' and event.key == K_RETURN:
                         self.state = 'PLAYING'
                         self.reset()
+            pygame.event.clear(pump=False)  # don't pump: a fresh QUIT/KEYDOWN would be flushed unseen
 
-            keys = pygame.key.get_pressed()
+            inputs = poll_inputs(pygame.key.get_pressed())
 
             # update
-            update_starfield(self.stars, dt)
-            if self.state == 'PLAYING':
-                self.update_playing(dt, keys)
-            # render
-            self.draw()
+            steps = 0
+            while self._acc >= FIXED_DT:
+                update_starfield(self.stars)
+                if self.state == 'PLAYING':
+                    self.update_playing(inputs)
+                self._acc -= FIXED_DT
+                steps += 1
+            # render (nothing moved if no step ran, so the last frame is still on screen)
+            if steps:
+                self.draw()
 
         pygame.quit()
         sys.exit()
 
-    def update_playing(self, dt, keys):
-        self.player.update(dt, keys)
-        self.enemy_group.update(dt)
-        self.bullet_group.update(dt)
+    def update_playing(self, inputs):
+        """Advance the game by one fixed step."""
+        self.player.update(inputs)
+        self.enemies.update()
+        self.bullets.update()
 
         # shooting
-        if (keys[K_SPACE] or keys[K_UP]) and self.player.can_shoot():
-            b = Bullet(self.player.rect.centerx, self.player.rect.top - 6, self.bullet_sprite)
-            self.bullet_group.add(b)
+        if inputs & INPUT_FIRE and self.player.can_shoot():
+            self.bullets.spawn(self.player.rect.centerx, self.player.rect.top - 6, -BULLET_STEP)
             self.player.shoot()
 
         # collisions: bullet hits enemy
-        hits = pygame.sprite.groupcollide(self.enemy_group, self.bullet_group, True, True)
-        if hits:
-            for en in hits:
-                self.score += 20
+        self.bucket_bullets()
+        cols = self._bullet_cols
+        bullet_alive = self.bullets.alive
+        bw, bh = self.bullets.img_rect_w, self.bullets.img_rect_h
+        hit_indices = []
+        enemy_alive = self.enemies.alive
+        for i, en in enumerate(self.enemies.sprites):
+            if not enemy_alive[i]:
+                continue
+            er = en.rect
+            for c in range(er.left // COLLISION_CELL, er.right // COLLISION_CELL + 1):
+                for j, bx, by in cols.get(c, ()):
+                    # a bullet spanning two columns is listed twice, and it can only hit one enemy
+                    if bullet_alive[j] and er.colliderect((bx, by, bw, bh)):
+                        bullet_alive[j] = False
+                        hit_indices.append(i)
+        if hit_indices:
+            # every bullet takes one hp; repeated indices are why this is subtract.at, not -=
+            np.subtract.at(self.enemies.hps, hit_indices, 1)
+            killed = enemy_alive & (self.enemies.hps <= 0)
+            enemy_alive &= ~killed
+            self.score += 20 * int(killed.sum())
+        self.enemies.sync()
+        self.bullets.compact()
 
         # enemy hits player
-        for e in self.enemy_group:
-            if e.rect.colliderect(self.player.rect):
-                # go to game over
-                self.state = 'GAME_OVER'
-                self.game_over_timer = 0
+        if self.player.rect.collidelist([e.rect for e in self.enemies.group]) != -1:
+            # go to game over
+            self.state = 'GAME_OVER'
+            self.game_over_timer = 0
 
         # spawn enemies
-        self.enemy_spawn_timer += dt
+        self.enemy_spawn_timer += FIXED_DT
         if self.enemy_spawn_timer >= ENEMY_SPAWN_INTERVAL:
             self.enemy_spawn_timer = 0
             self.spawn_enemy()
 
+    def score_surface(self):
+        if self._score_cache[0] != self.score:
+            self._score_cache = (self.score, self.font.render(f'SCORE: {self.score}', True, (240,240,230)))
+        return self._score_cache[1]
+
+    def bucket_bullets(self):
+        cols = self._bullet_cols
+        cols.clear()
+        w = self.bullets.img_rect_w
+        for j, (x, y) in enumerate(self.bullets.positions()):
+            for c in range(x // COLLISION_CELL, (x + w) // COLLISION_CELL + 1):
+                cols[c].append((j, x, y))
+
+    def blit(self, image, dest):
+        """Blit onto the screen and remember the area so the next frame can erase it."""
+        self._drawn.append(self.screen.blit(image, dest))
+
+    def blit_static(self, blits):
+        """Batch-blit a prebuilt list of (image, rect) pairs and remember their areas for erasing."""
+        blit_batch(self.screen, blits)
+        self._drawn.extend(r for _, r in blits)
+
+    def clear_screen(self):
+        if self._drawn_state != self.state:
+            self.screen.fill(BG_COLOR)
+            self._drawn_state = self.state
+        else:
+            bg = self._bg_tile
+            blit_batch(self.screen, [(bg, p) for p in self._star_prev.tolist()])
+            for r in self._drawn:
+                self.screen.fill(BG_COLOR, r)
+        self._drawn = []
+        self._star_prev = np.column_stack((self.stars['xs'], self.stars['ys'].astype(np.int32)))
+
     def draw(self):
-        self.screen.fill((20, 28, 36))
-        draw_starfield(self.screen, self.stars)
+        self.clear_screen()
+        draw_starfield(self.screen, self.stars, self._star1, self._star2)
 
         if self.state == 'MENU':
             self.draw_menu()
@@ -344,69 +714,24 @@ class Game:
         pygame.display.flip()
 
     def draw_menu(self):
-        # Title
-        title_surf = self.title_font.render('SPACE SHOOTER', True, (240, 230, 210))
-        title_rect = title_surf.get_rect(center=(WIDTH//2, 80))
-        # simple shadow
-        shadow = self.title_font.render('SPACE SHOOTER', True, (40, 30, 30))
-        self.screen.blit(shadow, shadow.get_rect(center=(title_rect.centerx+3, title_rect.centery+3)))
-        self.screen.blit(title_surf, title_rect)
-
-        # decorative sprites
-        self.screen.blit(self.player_sprite, self.player_sprite.get_rect(center=(WIDTH//2, HEIGHT//2 - 10)))
-        for x,y,t in self.decor_positions:
-            if t == 'planet':
-                self.screen.blit(self.planet_sprite, self.planet_sprite.get_rect(center=(x,y)))
-            elif t == 'saucer':
-                self.screen.blit(self.saucer_sprite, self.saucer_sprite.get_rect(center=(x,y)))
-            elif t == 'comet':
-                self.screen.blit(self.comet_sprite, self.comet_sprite.get_rect(center=(x,y)))
-
-        # start hint
-        hint = self.font.render('Press ENTER to start', True, (220,220,220))
-        self.screen.blit(hint, hint.get_rect(center=(WIDTH//2, HEIGHT - 120)))
-        # developer credit optional
-        if DEVELOPER_CREDIT:
-            cred = self.font.render(DEVELOPER_CREDIT, True, (180,180,180))
-            self.screen.blit(cred, cred.get_rect(center=(WIDTH//2, HEIGHT - 40)))
+        self.blit_static(self._menu_blits)
 
     def draw_playing(self):
         # sprites
-        self.enemy_group.draw(self.screen)
-        self.bullet_group.draw(self.screen)
+        self.enemies.group.draw(self.screen)
+        self._drawn.extend(sp.rect.copy() for sp in self.enemies.group)
+        self._drawn.extend(self.bullets.draw(self.screen))
         self.player_group.draw(self.screen)
+        self._drawn.append(self.player.rect.copy())
 
         # HUD
-        score_s = self.font.render(f'SCORE: {self.score}', True, (240,240,230))
-        self.screen.blit(score_s, (16, 12))
+        score_s = self.score_surface()
+        self.blit(score_s, (16, 12))
 
     def draw_game_over(self):
-        # draw some decorative objects in corners
-        self.screen.blit(self.planet_sprite, self.planet_sprite.get_rect(topleft=(20, 20)))
-        self.screen.blit(self.saucer_sprite, self.saucer_sprite.get_rect(topright=(WIDTH - 20, 20)))
-        # comet trailing in lower right
-        self.screen.blit(self.comet_sprite, self.comet_sprite.get_rect(bottomright=(WIDTH - 20, HEIGHT - 20)))
-
-        # big text
-        over = self.title_font.render('GAME OVER', True, (240,230,210))
-        over_rect = over.get_rect(center=(WIDTH//2, HEIGHT//2 - 60))
-        shadow = self.title_font.render('GAME OVER', True, (40,30,30))
-        self.screen.blit(shadow, shadow.get_rect(center=(over_rect.centerx+3, over_rect.centery+3)))
-        self.screen.blit(over, over_rect)
-
-        score_lbl = self.font.render(f'SCORE: {self.score}', True, (240,240,230))
-        self.screen.blit(score_lbl, score_lbl.get_rect(center=(WIDTH//2, HEIGHT//2 + 10)))
-
-        # decorative stars/arcs
-        for i in range(6):
-            x = 40 + i * 60
-            y = HEIGHT//2 + 120 + (i % 2) * 10
-            pygame.draw.rect(self.screen, (180,180,180), (x, y, 3, 3))
-
-        # replaced 'Developed by' removed from game over screen by default: user asked it removed
-        # show restart hint
-        hint = self.font.render('Press ENTER to play again', True, (200,200,200))
-        self.screen.blit(hint, hint.get_rect(center=(WIDTH//2, HEIGHT - 80)))
+        self.blit_static(self._game_over_blits)
+        score_lbl = self.score_surface()
+        self.blit(score_lbl, score_lbl.get_rect(center=(WIDTH//2, HEIGHT//2 + 10)))
 
 
 if __name__ == '__main__':